@@ -1,7 +1,11 @@
 import numpy as np
 import os
+import json
+import zipfile
 
 import sharpy.utils.generate_cases as gc
+import sharpy.utils.algebra as algebra
+import sharpy.aero.utils.airfoilpolars as ap
 import cases.templates.template_wt as template_wt
 from sharpy.utils.constants import deg2rad
 
@@ -37,20 +41,76 @@ time_steps = 2 # For the test cases
 
 mstar = int(revs_in_wake*2.*np.pi/dphi)
 
-rotor = template_wt.rotor_from_excel_type02(
-                                  chord_panels,
-                                  rotation_velocity,
-                                  pitch_deg,
-                                  excel_file_name = route + '../../../docs/source/content/example_notebooks/source/type02_db_NREL5MW_v01.xlsx',
-                                  excel_sheet_parameters = 'parameters',
-                                  excel_sheet_structural_blade = 'structural_blade',
-                                  excel_sheet_discretization_blade = 'discretization_blade',
-                                  excel_sheet_aero_blade = 'aero_blade',
-                                  excel_sheet_airfoil_info = 'airfoil_info',
-                                  excel_sheet_airfoil_coord = 'airfoil_coord',
-                                  m_distribution = 'uniform',
-                                  n_points_camber = 100,
-                                  tol_remove_points = 1e-8)
+excel_file_name = route + '../../../docs/source/content/example_notebooks/source/type02_db_NREL5MW_v01.xlsx'
+rotor_inputs = {'chord_panels': chord_panels,
+                'rotation_velocity': rotation_velocity,
+                'pitch_deg': pitch_deg,
+                'excel_file_name': excel_file_name,
+                'excel_sheet_parameters': 'parameters',
+                'excel_sheet_structural_blade': 'structural_blade',
+                'excel_sheet_discretization_blade': 'discretization_blade',
+                'excel_sheet_aero_blade': 'aero_blade',
+                'excel_sheet_airfoil_info': 'airfoil_info',
+                'excel_sheet_airfoil_coord': 'airfoil_coord',
+                'm_distribution': 'uniform',
+                'n_points_camber': 100,
+                'tol_remove_points': 1e-8}
+
+# Parsing the Excel database is slow: reuse the rotor generated in a previous run if neither the inputs,
+# the database nor the code that parses it have changed since. Only the arrays are cached and the
+# containers are rebuilt on load, so the cache never holds instances of the generate_cases classes
+rotor_containers = ['StructuralInformation', 'AerodynamicInformation']
+
+
+def save_rotor_cache(filename, key, rotor):
+    arrays = {'cache_key': np.array(json.dumps(key, sort_keys=True))}
+    for name in rotor_containers:
+        container = getattr(rotor, name)
+        default = getattr(gc, name)()
+        for attribute, value in vars(container).items():
+            # placeholders set by the constructor are restored when the container is rebuilt
+            if value is None or (isinstance(value, list) and all(item is None for item in value) and
+                                 value == getattr(default, attribute, None)):
+                continue
+            array = np.asarray(value)
+            if array.dtype == object:
+                # not storable as a plain array, the database will be parsed again next time
+                return
+            arrays[name + '.' + attribute] = array
+    np.savez(filename, **arrays)
+
+
+def load_rotor_cache(filename, key):
+    with np.load(filename, allow_pickle=False) as cache:
+        if str(cache['cache_key']) != json.dumps(key, sort_keys=True):
+            return None
+        rotor = gc.AeroelasticInformation()
+        for entry in cache.files:
+            if entry == 'cache_key':
+                continue
+            name, attribute = entry.split('.', 1)
+            if name not in rotor_containers:
+                raise KeyError(entry)
+            value = cache[entry]
+            setattr(getattr(rotor, name), attribute, value.item() if value.ndim == 0 else value)
+    return rotor
+
+
+rotor_cache = route + case + '_rotor_cache.npz'
+rotor_cache_key = {k: (v.tolist() if isinstance(v, np.ndarray) else v) for k, v in rotor_inputs.items()}
+rotor_sources = [excel_file_name, template_wt.__file__, gc.__file__, ap.__file__, algebra.__file__]
+rotor = None
+if (os.path.exists(rotor_cache) and
+        all(os.path.getmtime(rotor_cache) > os.path.getmtime(source) for source in rotor_sources)):
+    try:
+        rotor = load_rotor_cache(rotor_cache, rotor_cache_key)
+    except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+        # unreadable cache, e.g. truncated by an interrupted run: parse the database again
+        rotor = None
+
+if rotor is None:
+    rotor = template_wt.rotor_from_excel_type02(**rotor_inputs)
+    save_rotor_cache(rotor_cache, rotor_cache_key, rotor)
 
 ######################################################################
 ######################  DEFINE SIMULATION  ###########################
@@ -117,11 +177,16 @@ SimInfo.solvers['DynamicCoupled']['structural_solver'] = 'RigidDynamicPrescribed
 SimInfo.solvers['DynamicCoupled']['structural_solver_settings'] = SimInfo.solvers['RigidDynamicPrescribedStep']
 SimInfo.solvers['DynamicCoupled']['aero_solver'] = 'StepUvlm'
 SimInfo.solvers['DynamicCoupled']['aero_solver_settings'] = SimInfo.solvers['StepUvlm']
-SimInfo.solvers['DynamicCoupled']['postprocessors'] = ['BeamPlot', 'AerogridPlot', 'WriteVariablesTime', 'Cleanup']
-SimInfo.solvers['DynamicCoupled']['postprocessors_settings'] = {'BeamPlot': SimInfo.solvers['BeamPlot'],
-                                                             'AerogridPlot': SimInfo.solvers['AerogridPlot'],
-                                                             'WriteVariablesTime': SimInfo.solvers['WriteVariablesTime'],
-                                                             'Cleanup': SimInfo.solvers['Cleanup']}
+# Skip the per time step output in the short runs used for testing
+if time_steps <= 2:
+    SimInfo.solvers['DynamicCoupled']['postprocessors'] = []
+    SimInfo.solvers['DynamicCoupled']['postprocessors_settings'] = dict()
+else:
+    SimInfo.solvers['DynamicCoupled']['postprocessors'] = ['BeamPlot', 'AerogridPlot', 'WriteVariablesTime', 'Cleanup']
+    SimInfo.solvers['DynamicCoupled']['postprocessors_settings'] = {'BeamPlot': SimInfo.solvers['BeamPlot'],
+                                                                 'AerogridPlot': SimInfo.solvers['AerogridPlot'],
+                                                                 'WriteVariablesTime': SimInfo.solvers['WriteVariablesTime'],
+                                                                 'Cleanup': SimInfo.solvers['Cleanup']}
 SimInfo.solvers['DynamicCoupled']['minimum_steps'] = 0
 
 SimInfo.define_num_steps(time_steps)
@@ -130,9 +195,8 @@ SimInfo.define_num_steps(time_steps)
 SimInfo.with_forced_vel = True
 SimInfo.for_vel = np.zeros((time_steps,6), dtype=float)
 SimInfo.for_vel[:,5] = rotation_velocity
-SimInfo.for_acc = np.zeros((time_steps,6), dtype=float)
-SimInfo.with_dynamic_forces = True
-SimInfo.dynamic_forces = np.zeros((time_steps,rotor.StructuralInformation.num_node,6), dtype=float)
+# No external forces nor FoR accelerations: the beam loader fills both with zeros
+SimInfo.with_dynamic_forces = False
 
 
 ######################################################################
@@ -138,13 +138,21 @@ class FlightConditions(ct.Structure):
 t_2int = ct.POINTER(ct.c_int)*2
 
 
-def vlm_solver(ts_info, options):
-    run_VLM = UvlmLib.run_VLM
-    run_VLM.restype = None
+def vlm_options(options):
+    """
+    Packs the settings of the steady VLM solver into the ``VMopts`` structure passed to the UVLM library.
+
+    The structure only depends on the solver settings, so it can be built once and passed to every call of
+    :func:`vlm_solver`. The number of surfaces is set in :func:`vlm_solver` from the time step.
 
+    Args:
+        options (dict): ``StaticUvlm`` settings
+
+    Returns:
+        VMopts: Options of the VLM solver
+    """
     vmopts = VMopts()
     vmopts.Steady = ct.c_bool(True)
-    vmopts.NumSurfaces = ct.c_uint(ts_info.n_surf)
     vmopts.horseshoe = ct.c_bool(options['horseshoe'].value)
     vmopts.dt = ct.c_double(options["rollup_dt"].value)
     vmopts.n_rollup = ct.c_uint(options["n_rollup"].value)
@@ -157,6 +165,16 @@ def vlm_solver(ts_info, options):
     vmopts.cfl1 = ct.c_bool(options['cfl1'])
     vmopts.vortex_radius = ct.c_double(options['vortex_radius'].value)
     vmopts.vortex_radius_wake_ind = ct.c_double(options['vortex_radius_wake_ind'].value)
+    return vmopts
+
+
+def vlm_solver(ts_info, options, vmopts=None):
+    run_VLM = UvlmLib.run_VLM
+    run_VLM.restype = None
+
+    if vmopts is None:
+        vmopts = vlm_options(options)
+    vmopts.NumSurfaces = ct.c_uint(ts_info.n_surf)
 
     flightconditions = FlightConditions()
     flightconditions.rho = options['rho']
@@ -2,7 +2,6 @@ import sharpy.linear.utils.ss_interface as ss_interface
 import numpy as np
 import sharpy.linear.src.libss as libss
 import scipy.linalg as sclalg
-import warnings
 import sharpy.utils.settings as settings
 import sharpy.utils.cout_utils as cout
 import sharpy.utils.algebra as algebra
@@ -159,16 +158,23 @@ class LinearAeroelastic(ss_interface.BaseElement):
 
         if not self.load_uvlm_from_file:
             # Projecting the UVLM inputs and outputs onto the structural degrees of freedom
-            Ksa = self.Kforces[:beam.sys.num_dof, :]  # maps aerodynamic grid forces to nodal forces
+            # maps aerodynamic grid forces to nodal forces
+            # The row slice is a view of ``Kforces`` (no copy). ``addGain`` only reads it to build new ``C`` and ``D``
+            # matrices, so it is not duplicated here; ``Kforces`` must not be modified in place afterwards since
+            # ``couplings['Ksa']`` shares its memory.
+            Ksa = self.Kforces[:beam.sys.num_dof, :]
 
             # Map the nodal displacement and velocities onto the grid displacements and velocities
-            Kas = np.zeros((uvlm.ss.inputs, 2*beam.sys.num_dof + (uvlm.ss.inputs - 2*self.Kdisp.shape[0])))
-            Kas[:2*self.Kdisp.shape[0], :2*beam.sys.num_dof] = \
-                np.block([[self.Kdisp[:, :beam.sys.num_dof], self.Kdisp_vel[:, :beam.sys.num_dof]],
-                [self.Kvel_disp[:, :beam.sys.num_dof], self.Kvel_vel[:, :beam.sys.num_dof]]])
+            num_dof = beam.sys.num_dof
+            n_zeta = self.Kdisp.shape[0]
+            Kas = np.zeros((uvlm.ss.inputs, 2*num_dof + (uvlm.ss.inputs - 2*n_zeta)))
+            Kas[:n_zeta, :num_dof] = self.Kdisp[:, :num_dof]
+            Kas[:n_zeta, num_dof:2*num_dof] = self.Kdisp_vel[:, :num_dof]
+            Kas[n_zeta:2*n_zeta, :num_dof] = self.Kvel_disp[:, :num_dof]
+            Kas[n_zeta:2*n_zeta, num_dof:2*num_dof] = self.Kvel_vel[:, :num_dof]
 
             # Retain other inputs
-            Kas[2*self.Kdisp.shape[0]:, 2*beam.sys.num_dof:] = np.eye(uvlm.ss.inputs - 2 * self.Kdisp.shape[0])
+            Kas[2*n_zeta:, 2*num_dof:] = np.eye(uvlm.ss.inputs - 2 * n_zeta)
 
             # Scaling
             if uvlm.scaled:
@@ -177,17 +183,17 @@ class LinearAeroelastic(ss_interface.BaseElement):
             uvlm.ss.addGain(Ksa, where='out')
             uvlm.ss.addGain(Kas, where='in')
 
-            # Stiffenning and damping terms within the uvlm
-            Dmod = np.zeros_like(uvlm.ss.D)
-            Dmod[:flex_nodes, :flex_nodes] -= self.Kss
+            # Stiffenning and damping terms within the uvlm, accumulated in place onto the feedthrough blocks
             if rigid_dof > 0:
-                Dmod[flex_nodes:, :flex_nodes] -= self.Krs
-                Dmod[flex_nodes:, total_dof: total_dof + flex_nodes] -= self.Crs
-                Dmod[:flex_nodes, total_dof + flex_nodes: 2 * total_dof] -= self.Csr
-                Dmod[flex_nodes:, total_dof + flex_nodes: 2 * total_dof] -= self.Crr
                 if uvlm.scaled:
-                    Dmod /= uvlm.sys.ScalingFacts['force']
-                uvlm.ss.D += Dmod
+                    force_scale = uvlm.sys.ScalingFacts['force']
+                else:
+                    force_scale = 1.
+                uvlm.ss.D[:flex_nodes, :flex_nodes] -= self.Kss / force_scale
+                uvlm.ss.D[flex_nodes:, :flex_nodes] -= self.Krs / force_scale
+                uvlm.ss.D[flex_nodes:, total_dof: total_dof + flex_nodes] -= self.Crs / force_scale
+                uvlm.ss.D[:flex_nodes, total_dof + flex_nodes: 2 * total_dof] -= self.Csr / force_scale
+                uvlm.ss.D[flex_nodes:, total_dof + flex_nodes: 2 * total_dof] -= self.Crr / force_scale
 
             self.couplings['Ksa'] = Ksa
             self.couplings['Kas'] = Kas
@@ -215,19 +221,26 @@ class LinearAeroelastic(ss_interface.BaseElement):
         else:
             uvlm.ss = self.load_uvlm(self.settings['uvlm_filename'])
 
-        # Coupling matrices
-        Tas = np.eye(uvlm.ss.inputs, beam.ss.outputs)
-        Tsa = np.eye(beam.ss.inputs, uvlm.ss.outputs)
+        # Coupling matrices: (scaled) identities, hence the scaling is applied to their diagonals
+        Tas_diag = np.ones(min(uvlm.ss.inputs, beam.ss.outputs))
+        Tsa_diag = np.ones(min(beam.ss.inputs, uvlm.ss.outputs))
 
         # Scale coupling matrices
         if uvlm.scaled:
-            Tsa *= uvlm.sys.ScalingFacts['force'] * uvlm.sys.ScalingFacts['time'] ** 2
+            Tsa_diag *= uvlm.sys.ScalingFacts['force'] * uvlm.sys.ScalingFacts['time'] ** 2
             if rigid_dof > 0:
-                Tas[:flex_nodes + 6, :flex_nodes + 6] /= uvlm.sys.ScalingFacts['length']
-                Tas[total_dof: total_dof + flex_nodes + 6] /= uvlm.sys.ScalingFacts['length']
+                Tas_diag[:flex_nodes + 6] /= uvlm.sys.ScalingFacts['length']
+                Tas_diag[total_dof: total_dof + flex_nodes + 6] /= uvlm.sys.ScalingFacts['length']
             else:
                 if not self.settings['beam_settings']['modal_projection']:
-                    Tas /= uvlm.sys.ScalingFacts['length']
+                    Tas_diag /= uvlm.sys.ScalingFacts['length']
+
+        # kept dense: libss.couple densifies them when solving for the feedback loop and SaveData stores them as
+        # arrays
+        Tas = np.zeros((uvlm.ss.inputs, beam.ss.outputs))
+        np.fill_diagonal(Tas, Tas_diag)
+        Tsa = np.zeros((beam.ss.inputs, uvlm.ss.outputs))
+        np.fill_diagonal(Tsa, Tsa_diag)
 
         ss = libss.couple(ss01=uvlm.ss, ss02=beam.ss, K12=Tas, K21=Tsa)
 
@@ -41,6 +41,11 @@ class AeroForcesCalculator(BaseSolver):
     settings_default['text_file_name'] = 'aeroforces.txt'
     settings_description['text_file_name'] = 'Text file name'
 
+    settings_types['write_binary_file'] = 'bool'
+    settings_default['write_binary_file'] = False
+    settings_description['write_binary_file'] = 'Write ``npy`` file with results, named as ``text_file_name`` ' \
+                                                'with the ``.npy`` extension'
+
     settings_types['screen_output'] = 'bool'
     settings_default['screen_output'] = True
     settings_description['screen_output'] = 'Show results on screen'
@@ -61,6 +66,12 @@ class AeroForcesCalculator(BaseSolver):
     settings_default['S_ref'] = 1
     settings_description['S_ref'] = 'Reference area'
 
+    settings_types['always_calculate'] = 'bool'
+    settings_default['always_calculate'] = False
+    settings_description['always_calculate'] = 'Calculate and store the total forces in the aerodynamic time step ' \
+                                               'information even if no file or screen output is requested ' \
+                                               '(e.g. to save them with ``SaveData``)'
+
     settings_table = settings.SettingsTable()
     __doc__ += settings_table.generate(settings_types, settings_default, settings_description)
 
@@ -88,8 +99,14 @@ class AeroForcesCalculator(BaseSolver):
     def run(self, online=False):
         self.ts = 0
 
+        output_required = (self.settings['write_text_file'] or
+                           self.settings['write_binary_file'] or
+                           self.settings['screen_output'])
+        if not output_required and not self.settings['always_calculate']:
+            return self.data
+
         self.calculate_forces()
-        if self.settings['write_text_file']:
+        if self.settings['write_text_file'] or self.settings['write_binary_file']:
             self.folder = (self.settings['folder'] + '/' +
                            self.data.settings['SHARPy']['case'] + '/' +
                            'forces/')
@@ -104,24 +121,35 @@ class AeroForcesCalculator(BaseSolver):
         return self.data
 
     def calculate_forces(self):
-        for self.ts in range(self.ts_max):
-            rot = algebra.quat2rotation(self.data.structure.timestep_info[self.ts].quat)
-
-            force = self.data.aero.timestep_info[self.ts].forces
-            unsteady_force = self.data.aero.timestep_info[self.ts].dynamic_forces
-            n_surf = len(force)
-            for i_surf in range(n_surf):
-                total_steady_force = np.zeros((3,))
-                total_unsteady_force = np.zeros((3,))
-                _, n_rows, n_cols = force[i_surf].shape
-                for i_m in range(n_rows):
-                    for i_n in range(n_cols):
-                        total_steady_force += force[i_surf][0:3, i_m, i_n]
-                        total_unsteady_force += unsteady_force[i_surf][0:3, i_m, i_n]
-                self.data.aero.timestep_info[self.ts].inertial_steady_forces[i_surf, 0:3] = total_steady_force
-                self.data.aero.timestep_info[self.ts].inertial_unsteady_forces[i_surf, 0:3] = total_unsteady_force
-                self.data.aero.timestep_info[self.ts].body_steady_forces[i_surf, 0:3] = np.dot(rot.T, total_steady_force)
-                self.data.aero.timestep_info[self.ts].body_unsteady_forces[i_surf, 0:3] = np.dot(rot.T, total_unsteady_force)
+        for ts in range(self.ts_max):
+            self.calculate_inertial_forces(ts)
+
+        # project onto the A frame for all time steps and surfaces at once
+        # rotation matrices for the whole time history, C^{GA} at each time step
+        rot = np.array([algebra.quat2rotation(self.data.structure.timestep_info[ts].quat)
+                        for ts in range(self.ts_max)])
+        aero_tsteps = self.data.aero.timestep_info[:self.ts_max]
+        inertial_steady = np.array([aero_tstep.inertial_steady_forces[:, 0:3] for aero_tstep in aero_tsteps])
+        inertial_unsteady = np.array([aero_tstep.inertial_unsteady_forces[:, 0:3] for aero_tstep in aero_tsteps])
+        body_steady = np.einsum('tji,tsj->tsi', rot, inertial_steady)
+        body_unsteady = np.einsum('tji,tsj->tsi', rot, inertial_unsteady)
+        for ts, aero_tstep in enumerate(aero_tsteps):
+            aero_tstep.body_steady_forces[:, 0:3] = body_steady[ts]
+            aero_tstep.body_unsteady_forces[:, 0:3] = body_unsteady[ts]
+
+    def calculate_inertial_forces(self, ts):
+        """
+        Sums the steady and unsteady vertex forces of each surface at time step ``ts`` in the ``G`` FoR.
+
+        Args:
+            ts (int): Time step index
+        """
+        aero_tstep = self.data.aero.timestep_info[ts]
+        for i_surf in range(aero_tstep.n_surf):
+            # the reshape is a view of the vertex forces, so no copy is made before the reduction
+            aero_tstep.inertial_steady_forces[i_surf, 0:3] = aero_tstep.forces[i_surf][0:3].reshape(3, -1).sum(axis=1)
+            aero_tstep.inertial_unsteady_forces[i_surf, 0:3] = \
+                aero_tstep.dynamic_forces[i_surf][0:3].reshape(3, -1).sum(axis=1)
 
     def calculate_coefficients(self, fx, fy, fz):
         qS = self.settings['q_ref'].value * self.settings['S_ref'].value
@@ -136,14 +164,9 @@ class AeroForcesCalculator(BaseSolver):
                 'tstep', '  fx_g', '  fy_g', '  fz_g', '  Cfx_g', '  Cfy_g', '  Cfz_g')
             cout.cout_wrap(line, 1)
             for self.ts in range(self.ts_max):
-                fx = np.sum(self.data.aero.timestep_info[self.ts].inertial_steady_forces[:, 0], 0) + \
-                     np.sum(self.data.aero.timestep_info[self.ts].inertial_unsteady_forces[:, 0], 0)
-
-                fy = np.sum(self.data.aero.timestep_info[self.ts].inertial_steady_forces[:, 1], 0) + \
-                     np.sum(self.data.aero.timestep_info[self.ts].inertial_unsteady_forces[:, 1], 0)
-
-                fz = np.sum(self.data.aero.timestep_info[self.ts].inertial_steady_forces[:, 2], 0) + \
-                     np.sum(self.data.aero.timestep_info[self.ts].inertial_unsteady_forces[:, 2], 0)
+                aero_tstep = self.data.aero.timestep_info[self.ts]
+                fx, fy, fz = np.sum(aero_tstep.inertial_steady_forces[:, 0:3], 0) + \
+                             np.sum(aero_tstep.inertial_unsteady_forces[:, 0:3], 0)
 
                 Cfx, Cfy, Cfz = self.calculate_coefficients(fx, fy, fz)
 
@@ -155,14 +178,9 @@ class AeroForcesCalculator(BaseSolver):
                 'tstep', '  fx_g', '  fy_g', '  fz_g')
             cout.cout_wrap(line, 1)
             for self.ts in range(self.ts_max):
-                fx = np.sum(self.data.aero.timestep_info[self.ts].inertial_steady_forces[:, 0], 0) + \
-                     np.sum(self.data.aero.timestep_info[self.ts].inertial_unsteady_forces[:, 0], 0)
-
-                fy = np.sum(self.data.aero.timestep_info[self.ts].inertial_steady_forces[:, 1], 0) + \
-                     np.sum(self.data.aero.timestep_info[self.ts].inertial_unsteady_forces[:, 1], 0)
-
-                fz = np.sum(self.data.aero.timestep_info[self.ts].inertial_steady_forces[:, 2], 0) + \
-                     np.sum(self.data.aero.timestep_info[self.ts].inertial_unsteady_forces[:, 2], 0)
+                aero_tstep = self.data.aero.timestep_info[self.ts]
+                fx, fy, fz = np.sum(aero_tstep.inertial_steady_forces[:, 0:3], 0) + \
+                             np.sum(aero_tstep.inertial_unsteady_forces[:, 0:3], 0)
 
                 line = "{0:5d} | {1: 8.3e} | {2: 8.3e} | {3: 8.3e}".format(
                     self.ts, fx, fy, fz)
@@ -172,17 +190,15 @@ class AeroForcesCalculator(BaseSolver):
         # assemble forces matrix
         # (1 timestep) + (3+3 inertial steady+unsteady) + (3+3 body steady+unsteady)
         force_matrix = np.zeros((self.ts_max, 1 + 3 + 3 + 3 + 3))
-        for self.ts in range(self.ts_max):
-            i = 0
-            force_matrix[self.ts, i] = self.ts
-            i += 1
-            force_matrix[self.ts, i:i+3] = np.sum(self.data.aero.timestep_info[self.ts].inertial_steady_forces[:, 0:3], 0)
-            i += 3
-            force_matrix[self.ts, i:i+3] = np.sum(self.data.aero.timestep_info[self.ts].inertial_unsteady_forces[:, 0:3], 0)
+        aero_tsteps = self.data.aero.timestep_info[:self.ts_max]
+        force_matrix[:, 0] = np.arange(self.ts_max)
+        i = 1
+        for attribute in ['inertial_steady_forces', 'inertial_unsteady_forces',
+                          'body_steady_forces', 'body_unsteady_forces']:
+            # [ts_max x n_surf x 6] history, summed over the surfaces
+            history = np.array([getattr(tstep, attribute) for tstep in aero_tsteps])
+            force_matrix[:, i:i+3] = history[:, :, 0:3].sum(axis=1)
             i += 3
-            force_matrix[self.ts, i:i+3] = np.sum(self.data.aero.timestep_info[self.ts].body_steady_forces[:, 0:3], 0)
-            i += 3
-            force_matrix[self.ts, i:i+3] = np.sum(self.data.aero.timestep_info[self.ts].body_unsteady_forces[:, 0:3], 0)
 
         header = ''
         header += 'tstep, '
@@ -191,9 +207,12 @@ class AeroForcesCalculator(BaseSolver):
         header += 'fx_steady_a, fy_steady_a, fz_steady_a, '
         header += 'fx_unsteady_a, fy_unsteady_a, fz_unsteady_a'
 
-        np.savetxt(self.folder,
-                   force_matrix,
-                   fmt='%i' + ', %10e'*12,
-                   delimiter=',',
-                   header=header,
-                   comments='#')
+        if self.settings['write_text_file']:
+            # format the whole matrix in a single operation rather than row by row as in np.savetxt
+            row_format = '%i' + ', %10e'*12 + '\n'
+            with open(self.folder, 'w') as outfile:
+                outfile.write('#' + header + '\n')
+                outfile.write((row_format * self.ts_max) % tuple(force_matrix.ravel()))
+
+        if self.settings['write_binary_file']:
+            np.save(os.path.splitext(self.folder)[0] + '.npy', force_matrix)
@@ -1,7 +1,8 @@
 import os
 
 import numpy as np
-from tvtk.api import tvtk, write_data
+from tvtk.api import tvtk
+from tvtk.common import configure_input
 
 import sharpy.utils.algebra as algebra
 import sharpy.utils.cout_utils as cout
@@ -62,6 +63,7 @@ class AerogridPlot(BaseSolver):
 
     settings_types['num_cores'] = 'int'
     settings_default['num_cores'] = 1
+    settings_description['num_cores'] = 'Number of cores used by the UVLM library to compute the induced velocities'
 
     settings_types['vortex_radius'] = 'float'
     settings_default['vortex_radius'] = vortex_radius_def
@@ -79,6 +81,7 @@ class AerogridPlot(BaseSolver):
         self.wake_filename = ''
         self.ts_max = 0
         self.caller = None
+        self.writers = dict()
 
     def initialise(self, data, custom_settings=None, caller=None):
         self.data = data
@@ -88,12 +91,9 @@ class AerogridPlot(BaseSolver):
             self.settings = custom_settings
         settings.to_custom_types(self.settings, self.settings_types, self.settings_default)
         self.ts_max = self.data.ts + 1
-        # create folder for containing files if necessary
-        if not os.path.exists(self.settings['folder']):
-            os.makedirs(self.settings['folder'])
+        # create folder for containing files if necessary, once per post-processor rather than per time step
         self.folder = self.settings['folder'] + '/' + self.data.settings['SHARPy']['case'] + '/aero/'
-        if not os.path.exists(self.folder):
-            os.makedirs(self.folder)
+        os.makedirs(self.folder, exist_ok=True)
         self.body_filename = (self.folder +
                               self.settings['name_prefix'] +
                               'body_' +
@@ -106,24 +106,44 @@ class AerogridPlot(BaseSolver):
 
     def run(self, online=False):
         # TODO: Create a dictionary to plot any variable as in beamplot
+        # Performance note: the cost of this post-processor is the rearrangement of the grid data into VTK order
+        # (whole-array NumPy) and the serialisation of the VTU files, i.e. it is I/O bound rather than compute bound.
+        # Measure changes in seconds per surface file written, not in floating point throughput.
         if not online:
-            for self.ts in range(self.ts_max):
-                if self.data.structure.timestep_info[self.ts] is not None:
-                    self.plot_body()
-                    self.plot_wake()
+            for ts in range(self.ts_max):
+                if self.data.structure.timestep_info[ts] is not None:
+                    self.plot_body(ts)
+                    self.plot_wake(ts)
             cout.cout_wrap('...Finished', 1)
         else:
             aero_tsteps = len(self.data.aero.timestep_info) - 1
             struct_tsteps = len(self.data.structure.timestep_info) - 1
-            self.ts = np.max((aero_tsteps, struct_tsteps))
-            self.plot_body()
-            self.plot_wake()
+            ts = np.max((aero_tsteps, struct_tsteps))
+            self.plot_body(ts)
+            self.plot_wake(ts)
         return self.data
 
-    def plot_body(self):
+    def grid_offset(self, ts, struct_tstep):
+        """
+        Translation applied to the grid coordinates of every surface in the time step, given by the position of the
+        ``A`` frame (``include_rbm``) and the forward motion of the free stream (``include_forward_motion``).
 
-        aero_tstep = self.data.aero.timestep_info[self.ts]
-        struct_tstep = self.data.structure.timestep_info[self.ts]
+        Returns:
+            np.ndarray: Offset ``[3]``, or ``None`` if the coordinates are left untouched
+        """
+        if not (self.settings['include_rbm'] or self.settings['include_forward_motion']):
+            return None
+        offset = np.zeros((3,))
+        if self.settings['include_rbm']:
+            offset += struct_tstep.for_pos[0:3]
+        if self.settings['include_forward_motion']:
+            offset[0] -= self.settings['dt'].value*ts*self.settings['u_inf'].value
+        return offset
+
+    def plot_body(self, ts):
+
+        aero_tstep = self.data.aero.timestep_info[ts]
+        struct_tstep = self.data.structure.timestep_info[ts]
 
         if self.settings['include_incidence_angle']:
             aero_tstep.postproc_cell['incidence_angle'] = []
@@ -134,183 +154,192 @@ class AerogridPlot(BaseSolver):
             uvlmlib.uvlm_calculate_incidence_angle(aero_tstep,
                                                    struct_tstep)
 
+        offset = self.grid_offset(ts, struct_tstep)
         for i_surf in range(aero_tstep.n_surf):
-            filename = (self.body_filename +
-                        '_' +
-                        '%02u_' % i_surf +
-                        '%06u' % self.ts)
-
-            dims = aero_tstep.dimensions[i_surf, :]
-            point_data_dim = (dims[0]+1)*(dims[1]+1)  # + (dims_star[0]+1)*(dims_star[1]+1)
-            panel_data_dim = (dims[0])*(dims[1])  # + (dims_star[0])*(dims_star[1])
-
-            coords = np.zeros((point_data_dim, 3))
-            conn = []
-            panel_id = np.zeros((panel_data_dim,), dtype=int)
-            panel_surf_id = np.zeros((panel_data_dim,), dtype=int)
-            panel_gamma = np.zeros((panel_data_dim,))
-            panel_gamma_dot = np.zeros((panel_data_dim,))
-            normal = np.zeros((panel_data_dim, 3))
-            point_struct_id = np.zeros((point_data_dim,), dtype=int)
-            point_cf = np.zeros((point_data_dim, 3))
+            self.plot_body_surface(i_surf, ts, aero_tstep, struct_tstep, offset)
+
+    def plot_body_surface(self, i_surf, ts, aero_tstep, struct_tstep, offset):
+        filename = (self.body_filename +
+                    '_' +
+                    '%02u_' % i_surf +
+                    '%06u' % ts)
+
+        dims = aero_tstep.dimensions[i_surf, :]
+        point_data_dim = (dims[0]+1)*(dims[1]+1)  # + (dims_star[0]+1)*(dims_star[1]+1)
+        panel_data_dim = (dims[0])*(dims[1])  # + (dims_star[0])*(dims_star[1])
+
+        # coordinates of corners
+        # point data is ordered with the spanwise index running slowest: [(i_n, i_m) for i_n... for i_m...]
+        coords = self.grid_to_vtk_order(aero_tstep.zeta[i_surf])
+        if offset is not None:
+            coords += offset
+
+        # point data
+        # zero-filled arrays are only allocated for the variables missing in the time step
+        point_cf = self.grid_to_vtk_order(aero_tstep.forces[i_surf][0:3])
+        try:
+            point_unsteady_cf = self.grid_to_vtk_order(aero_tstep.dynamic_forces[i_surf][0:3])
+        except AttributeError:
             point_unsteady_cf = np.zeros((point_data_dim, 3))
+        try:
+            zeta_dot = self.grid_to_vtk_order(aero_tstep.zeta_dot[i_surf][0:3])
+        except AttributeError:
             zeta_dot = np.zeros((point_data_dim, 3))
+        try:
+            u_inf = self.grid_to_vtk_order(aero_tstep.u_ext[i_surf][0:3])
+        except AttributeError:
             u_inf = np.zeros((point_data_dim, 3))
-            if self.settings['include_velocities']:
-                vel = np.zeros((point_data_dim, 3))
-            counter = -1
-
-            # coordinates of corners
-            for i_n in range(dims[1]+1):
-                for i_m in range(dims[0]+1):
-                    counter += 1
-                    coords[counter, :] = aero_tstep.zeta[i_surf][:, i_m, i_n]
-                    if self.settings['include_rbm']:
-                        coords[counter, :] += struct_tstep.for_pos[0:3]
-                    if self.settings['include_forward_motion']:
-                        coords[counter, 0] -= self.settings['dt'].value*self.ts*self.settings['u_inf'].value
-
-            if self.settings['include_incidence_angle']:
-                incidence_angle = np.zeros_like(panel_gamma)
-
-            counter = -1
-            node_counter = -1
-            for i_n in range(dims[1] + 1):
-                global_counter = self.data.aero.aero2struct_mapping[i_surf][i_n]
-                for i_m in range(dims[0] + 1):
-                    node_counter += 1
-                    # point data
-                    point_struct_id[node_counter] = global_counter
-                    point_cf[node_counter, :] = aero_tstep.forces[i_surf][0:3, i_m, i_n]
-                    try:
-                        point_unsteady_cf[node_counter, :] = aero_tstep.dynamic_forces[i_surf][0:3, i_m, i_n]
-                    except AttributeError:
-                        pass
-                    try:
-                        zeta_dot[node_counter, :] = aero_tstep.zeta_dot[i_surf][0:3, i_m, i_n]
-                    except AttributeError:
-                        pass
-                    try:
-                        u_inf[node_counter, :] = aero_tstep.u_ext[i_surf][0:3, i_m, i_n]
-                    except AttributeError:
-                        pass
-                    if i_n < dims[1] and i_m < dims[0]:
-                        counter += 1
-                    else:
-                        continue
-
-                    conn.append([node_counter + 0,
-                                 node_counter + 1,
-                                 node_counter + dims[0]+2,
-                                 node_counter + dims[0]+1])
-                    # cell data
-                    normal[counter, :] = aero_tstep.normals[i_surf][:, i_m, i_n]
-                    panel_id[counter] = counter
-                    panel_surf_id[counter] = i_surf
-                    panel_gamma[counter] = aero_tstep.gamma[i_surf][i_m, i_n]
-                    panel_gamma_dot[counter] = aero_tstep.gamma_dot[i_surf][i_m, i_n]
-
-                    if self.settings['include_incidence_angle']:
-                        incidence_angle[counter] = \
-                            aero_tstep.postproc_cell['incidence_angle'][i_surf][i_m, i_n]
-
-            if self.settings['include_velocities']:
-                vel = uvlmlib.uvlm_calculate_total_induced_velocity_at_points(aero_tstep,
-                                                                              coords,
-                                                                              self.settings['vortex_radius'],
-                                                                              struct_tstep.for_pos,
-                                                                              self.settings['numcores'])
-
-            ug = tvtk.UnstructuredGrid(points=coords)
-            ug.set_cells(tvtk.Quad().cell_type, conn)
-            ug.cell_data.scalars = panel_id
-            ug.cell_data.scalars.name = 'panel_n_id'
-            ug.cell_data.add_array(panel_surf_id)
-            ug.cell_data.get_array(1).name = 'panel_surface_id'
-            ug.cell_data.add_array(panel_gamma)
-            ug.cell_data.get_array(2).name = 'panel_gamma'
-            ug.cell_data.add_array(panel_gamma_dot)
-            ug.cell_data.get_array(3).name = 'panel_gamma_dot'
-            if self.settings['include_incidence_angle']:
-                ug.cell_data.add_array(incidence_angle)
-                ug.cell_data.get_array(4).name = 'incidence_angle'
-            ug.cell_data.vectors = normal
-            ug.cell_data.vectors.name = 'panel_normal'
-            ug.point_data.scalars = np.arange(0, coords.shape[0])
-            ug.point_data.scalars.name = 'n_id'
-            ug.point_data.add_array(point_struct_id)
-            ug.point_data.get_array(1).name = 'point_struct_id'
-            ug.point_data.add_array(point_cf)
-            ug.point_data.get_array(2).name = 'point_steady_force'
-            ug.point_data.add_array(point_unsteady_cf)
-            ug.point_data.get_array(3).name = 'point_unsteady_force'
-            ug.point_data.add_array(zeta_dot)
-            ug.point_data.get_array(4).name = 'zeta_dot'
-            ug.point_data.add_array(u_inf)
-            ug.point_data.get_array(5).name = 'u_inf'
-            if self.settings['include_velocities']:
-                ug.point_data.add_array(vel)
-                ug.point_data.get_array(6).name = 'velocity'
-            write_data(ug, filename)
-
-    def plot_wake(self):
-        for i_surf in range(self.data.aero.timestep_info[self.ts].n_surf):
-            filename = (self.wake_filename +
-                        '_' +
-                        '%02u_' % i_surf +
-                        '%06u' % self.ts)
-
-            dims_star = self.data.aero.timestep_info[self.ts].dimensions_star[i_surf, :].copy()
-            dims_star[0] -= self.settings['minus_m_star']
-
-            point_data_dim = (dims_star[0]+1)*(dims_star[1]+1)
-            panel_data_dim = (dims_star[0])*(dims_star[1])
-
-            coords = np.zeros((point_data_dim, 3))
-            conn = []
-            panel_id = np.zeros((panel_data_dim,), dtype=int)
-            panel_surf_id = np.zeros((panel_data_dim,), dtype=int)
-            panel_gamma = np.zeros((panel_data_dim,))
-            counter = -1
-            # rotation_mat = self.data.structure.timestep_info[self.ts].cga().T
-            # coordinates of corners
-            for i_n in range(dims_star[1]+1):
-                for i_m in range(dims_star[0]+1):
-                    counter += 1
-                    coords[counter, :] = self.data.aero.timestep_info[self.ts].zeta_star[i_surf][:, i_m, i_n]
-                    if self.settings['include_rbm']:
-                        coords[counter, :] += self.data.structure.timestep_info[self.ts].for_pos[0:3]
-                    if self.settings['include_forward_motion']:
-                        coords[counter, 0] -= self.settings['dt'].value*self.ts*self.settings['u_inf'].value
-
-            counter = -1
-            node_counter = -1
-            # wake
-            for i_n in range(dims_star[1]+1):
-                for i_m in range(dims_star[0]+1):
-                    node_counter += 1
-                    # cell data
-                    if i_n < dims_star[1] and i_m < dims_star[0]:
-                        counter += 1
-                    else:
-                        continue
-
-                    conn.append([node_counter + 0,
-                                 node_counter + 1,
-                                 node_counter + dims_star[0]+2,
-                                 node_counter + dims_star[0]+1])
-                    panel_id[counter] = counter
-                    panel_surf_id[counter] = i_surf
-                    panel_gamma[counter] = self.data.aero.timestep_info[self.ts].gamma_star[i_surf][i_m, i_n]
-
-            ug = tvtk.UnstructuredGrid(points=coords)
-            ug.set_cells(tvtk.Quad().cell_type, conn)
-            ug.cell_data.scalars = panel_id
-            ug.cell_data.scalars.name = 'panel_n_id'
-            ug.cell_data.add_array(panel_surf_id)
-            ug.cell_data.get_array(1).name = 'panel_surface_id'
-            ug.cell_data.add_array(panel_gamma)
-            ug.cell_data.get_array(2).name = 'panel_gamma'
-            ug.point_data.scalars = np.arange(0, coords.shape[0])
-            ug.point_data.scalars.name = 'n_id'
-            write_data(ug, filename)
+
+        # all the vertices of a chordwise row are mapped to the same structural node
+        point_struct_id = np.repeat(
+            np.asarray(self.data.aero.aero2struct_mapping[i_surf][:dims[1] + 1], dtype=int), dims[0] + 1)
+
+        # cell data
+        conn = self.quad_connectivity(dims[0], dims[1])
+        normal = self.grid_to_vtk_order(aero_tstep.normals[i_surf])
+        panel_id = np.arange(panel_data_dim, dtype=int)
+        panel_surf_id = np.full((panel_data_dim,), i_surf, dtype=int)
+        panel_gamma = self.grid_to_vtk_order(aero_tstep.gamma[i_surf])
+        panel_gamma_dot = self.grid_to_vtk_order(aero_tstep.gamma_dot[i_surf])
+        if self.settings['include_incidence_angle']:
+            incidence_angle = self.grid_to_vtk_order(aero_tstep.postproc_cell['incidence_angle'][i_surf])
+
+        if self.settings['include_velocities']:
+            vel = uvlmlib.uvlm_calculate_total_induced_velocity_at_points(aero_tstep,
+                                                                          coords,
+                                                                          self.settings['vortex_radius'],
+                                                                          struct_tstep.for_pos,
+                                                                          self.settings['num_cores'])
+
+        ug = tvtk.UnstructuredGrid(points=coords)
+        ug.set_cells(tvtk.Quad().cell_type, conn)
+        ug.cell_data.scalars = panel_id
+        ug.cell_data.scalars.name = 'panel_n_id'
+        ug.cell_data.add_array(panel_surf_id)
+        ug.cell_data.get_array(1).name = 'panel_surface_id'
+        ug.cell_data.add_array(panel_gamma)
+        ug.cell_data.get_array(2).name = 'panel_gamma'
+        ug.cell_data.add_array(panel_gamma_dot)
+        ug.cell_data.get_array(3).name = 'panel_gamma_dot'
+        if self.settings['include_incidence_angle']:
+            ug.cell_data.add_array(incidence_angle)
+            ug.cell_data.get_array(4).name = 'incidence_angle'
+        ug.cell_data.vectors = normal
+        ug.cell_data.vectors.name = 'panel_normal'
+        ug.point_data.scalars = np.arange(0, coords.shape[0])
+        ug.point_data.scalars.name = 'n_id'
+        ug.point_data.add_array(point_struct_id)
+        ug.point_data.get_array(1).name = 'point_struct_id'
+        ug.point_data.add_array(point_cf)
+        ug.point_data.get_array(2).name = 'point_steady_force'
+        ug.point_data.add_array(point_unsteady_cf)
+        ug.point_data.get_array(3).name = 'point_unsteady_force'
+        ug.point_data.add_array(zeta_dot)
+        ug.point_data.get_array(4).name = 'zeta_dot'
+        ug.point_data.add_array(u_inf)
+        ug.point_data.get_array(5).name = 'u_inf'
+        if self.settings['include_velocities']:
+            ug.point_data.add_array(vel)
+            ug.point_data.get_array(6).name = 'velocity'
+        self.write_grid(ug, filename, ('body', i_surf))
+
+    def write_grid(self, ug, filename, key):
+        """
+        Writes the grid to ``filename.vtu`` as zlib compressed binary data appended to the XML file, a format read
+        natively by ParaView.
+
+        One writer is kept per ``key`` and reused in every time step.
+
+        Args:
+            ug (tvtk.UnstructuredGrid): Grid to write
+            filename (str): Path of the file without extension
+            key (tuple): Identifier of the writer, ``(kind, i_surf)``
+        """
+        try:
+            writer = self.writers[key]
+        except KeyError:
+            writer = tvtk.XMLUnstructuredGridWriter(data_mode='appended',
+                                                    compressor=tvtk.ZLibDataCompressor())
+            self.writers[key] = writer
+        writer.file_name = filename + '.vtu'
+        configure_input(writer, ug)
+        writer.write()
+
+    @staticmethod
+    def grid_to_vtk_order(grid_data):
+        """
+        Rearranges data defined on the vertices or panels of a grid into the VTK ordering, in which the chordwise
+        index runs fastest.
+
+        Args:
+            grid_data (np.ndarray): Vector ``[3 x M x N]`` or scalar ``[M x N]`` grid data
+
+        Returns:
+            np.ndarray: Contiguous copy of the data, ``[MN x 3]`` for vectors or ``[MN]`` for scalars
+        """
+        if grid_data.ndim == 3:
+            return np.ascontiguousarray(grid_data.transpose(2, 1, 0).reshape(-1, 3), dtype=np.float64)
+        return grid_data.T.flatten().astype(np.float64, copy=False)
+
+    @staticmethod
+    def quad_connectivity(m, n):
+        """
+        Connectivity of the quadrilateral panels of a structured ``m x n`` panel grid whose ``(m + 1)(n + 1)``
+        vertices are in the VTK ordering given by :meth:`grid_to_vtk_order`.
+
+        Args:
+            m (int): Number of chordwise (or streamwise) panels
+            n (int): Number of spanwise panels
+
+        Returns:
+            np.ndarray: Vertex indices of each panel ``[mn x 4]``
+        """
+        first_node = (np.arange(n)[:, None]*(m + 1) + np.arange(m)[None, :]).ravel()
+        return np.stack((first_node,
+                         first_node + 1,
+                         first_node + m + 2,
+                         first_node + m + 1), axis=1)
+
+    def plot_wake(self, ts):
+        aero_tstep = self.data.aero.timestep_info[ts]
+        struct_tstep = self.data.structure.timestep_info[ts]
+        offset = self.grid_offset(ts, struct_tstep)
+        for i_surf in range(aero_tstep.n_surf):
+            self.plot_wake_surface(i_surf, ts, aero_tstep, struct_tstep, offset)
+
+    def plot_wake_surface(self, i_surf, ts, aero_tstep, struct_tstep, offset):
+        filename = (self.wake_filename +
+                    '_' +
+                    '%02u_' % i_surf +
+                    '%06u' % ts)
+
+        zeta_star = aero_tstep.zeta_star[i_surf]
+        gamma_star = aero_tstep.gamma_star[i_surf]
+        dims_star = aero_tstep.dimensions_star[i_surf, :].copy()
+        dims_star[0] -= self.settings['minus_m_star']
+
+        panel_data_dim = (dims_star[0])*(dims_star[1])
+
+        # rotation_mat = struct_tstep.cga().T
+        # coordinates of corners
+        coords = self.grid_to_vtk_order(zeta_star[:, :dims_star[0]+1, :])
+        if offset is not None:
+            coords += offset
+
+        # wake
+        conn = self.quad_connectivity(dims_star[0], dims_star[1])
+        panel_id = np.arange(panel_data_dim, dtype=int)
+        panel_surf_id = np.full((panel_data_dim,), i_surf, dtype=int)
+        panel_gamma = self.grid_to_vtk_order(gamma_star[:dims_star[0], :])
+
+        ug = tvtk.UnstructuredGrid(points=coords)
+        ug.set_cells(tvtk.Quad().cell_type, conn)
+        ug.cell_data.scalars = panel_id
+        ug.cell_data.scalars.name = 'panel_n_id'
+        ug.cell_data.add_array(panel_surf_id)
+        ug.cell_data.get_array(1).name = 'panel_surface_id'
+        ug.cell_data.add_array(panel_gamma)
+        ug.cell_data.get_array(2).name = 'panel_gamma'
+        ug.point_data.scalars = np.arange(0, coords.shape[0])
+        ug.point_data.scalars.name = 'n_id'
+        self.write_grid(ug, filename, ('wake', i_surf))
@@ -114,6 +114,8 @@ class StaticUvlm(BaseSolver):
         self.data = None
         self.settings = None
         self.velocity_generator = None
+        self.velocity_generator_params = None
+        self.vmopts = None
 
     def initialise(self, data, custom_settings=None):
         self.data = data
@@ -122,6 +124,8 @@ class StaticUvlm(BaseSolver):
         else:
             self.settings = custom_settings
         settings.to_custom_types(self.settings, self.settings_types, self.settings_default)
+        # the VLM options only depend on the settings, so they are packed for the UVLM library once
+        self.vmopts = uvlmlib.vlm_options(self.settings)
 
         self.update_step()
 
@@ -130,13 +134,20 @@ class StaticUvlm(BaseSolver):
             self.settings['velocity_field_generator'])
         self.velocity_generator = velocity_generator_type()
         self.velocity_generator.initialise(self.settings['velocity_field_input'])
+        # the generators only read their input in generate(), so the same dictionary is reused in every run
+        self.velocity_generator_params = {'zeta': None,
+                                          'override': True,
+                                          'for_pos': None}
 
     def run(self):
-        if not self.data.aero.timestep_info[self.data.ts].zeta:
+        # the solution itself happens in the UVLM library: the Python side only prepares its inputs, so the overhead
+        # to keep small is the time spent here per call outside uvlmlib.vlm_solver
+        aero_tstep = self.data.aero.timestep_info[self.data.ts]
+        if not aero_tstep.zeta:
             return self.data
+        struct_tstep = self.data.structure.timestep_info[self.data.ts]
 
         # generate the wake because the solid shape might change
-        aero_tstep = self.data.aero.timestep_info[self.data.ts]
         self.data.aero.wake_shape_generator.generate({'zeta': aero_tstep.zeta,
                                             'zeta_star': aero_tstep.zeta_star,
                                             'gamma': aero_tstep.gamma,
@@ -144,13 +155,14 @@ class StaticUvlm(BaseSolver):
                                             'dist_to_orig': aero_tstep.dist_to_orig})
 
         # generate uext
-        self.velocity_generator.generate({'zeta': self.data.aero.timestep_info[self.data.ts].zeta,
-                                          'override': True,
-                                          'for_pos': self.data.structure.timestep_info[self.data.ts].for_pos[0:3]},
-                                         self.data.aero.timestep_info[self.data.ts].u_ext)
+        self.velocity_generator_params['zeta'] = aero_tstep.zeta
+        self.velocity_generator_params['for_pos'] = struct_tstep.for_pos[0:3]
+        self.velocity_generator.generate(self.velocity_generator_params,
+                                         aero_tstep.u_ext)
         # grid orientation
-        uvlmlib.vlm_solver(self.data.aero.timestep_info[self.data.ts],
-                           self.settings)
+        uvlmlib.vlm_solver(aero_tstep,
+                           self.settings,
+                           self.vmopts)
 
         return self.data
 
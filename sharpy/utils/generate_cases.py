@@ -1814,8 +1814,10 @@ class SimulationInformation():
                 # TODO: check coherence velocity-acceleration
                 h5file.create_dataset(
                     'for_vel', data=self.for_vel)
-                h5file.create_dataset(
-                    'for_acc', data=self.for_acc)
+                # the beam loader assumes zero acceleration if it is not provided
+                if self.for_acc is not None:
+                    h5file.create_dataset(
+                        'for_acc', data=self.for_acc)
             h5file.create_dataset(
                 'num_steps', data=num_steps)
 
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+import types
+import numpy as np
+
+import sharpy.utils.settings as settings
+import sharpy.utils.cout_utils as cout
+from sharpy.postproc.aeroforcescalculator import AeroForcesCalculator
+
+
+class TestAeroForcesCalculatorOutput(unittest.TestCase):
+    """
+    Tests the forces file written by the ``AeroForcesCalculator`` post-processor
+    """
+
+    def setUp(self):
+        cout.start_writer()
+        np.random.seed(0)
+        self.ts_max = 7
+        self.n_surf = 3
+
+        aero_tsteps = []
+        for ts in range(self.ts_max):
+            aero_tstep = types.SimpleNamespace()
+            for attribute in ['inertial_steady_forces', 'inertial_unsteady_forces',
+                              'body_steady_forces', 'body_unsteady_forces']:
+                setattr(aero_tstep, attribute, np.random.randn(self.n_surf, 6)*10**np.random.randint(-8, 8))
+            aero_tsteps.append(aero_tstep)
+
+        self.calculator = AeroForcesCalculator()
+        self.calculator.data = types.SimpleNamespace(aero=types.SimpleNamespace(timestep_info=aero_tsteps))
+        self.calculator.ts_max = self.ts_max
+
+        self.expected_matrix = np.zeros((self.ts_max, 13))
+        self.expected_matrix[:, 0] = np.arange(self.ts_max)
+        for ts, aero_tstep in enumerate(aero_tsteps):
+            self.expected_matrix[ts, 1:4] = np.sum(aero_tstep.inertial_steady_forces[:, 0:3], axis=0)
+            self.expected_matrix[ts, 4:7] = np.sum(aero_tstep.inertial_unsteady_forces[:, 0:3], axis=0)
+            self.expected_matrix[ts, 7:10] = np.sum(aero_tstep.body_steady_forces[:, 0:3], axis=0)
+            self.expected_matrix[ts, 10:13] = np.sum(aero_tstep.body_unsteady_forces[:, 0:3], axis=0)
+
+        self.header = ('tstep, '
+                       'fx_steady_G, fy_steady_G, fz_steady_G, '
+                       'fx_unsteady_G, fy_unsteady_G, fz_unsteady_G, '
+                       'fx_steady_a, fy_steady_a, fz_steady_a, '
+                       'fx_unsteady_a, fy_unsteady_a, fz_unsteady_a')
+
+        self.output_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.output_dir.cleanup()
+        cout.finish_writer()
+
+    def run_file_output(self, write_text_file, write_binary_file):
+        calculator_settings = {'write_text_file': write_text_file,
+                               'write_binary_file': write_binary_file}
+        settings.to_custom_types(calculator_settings,
+                                 AeroForcesCalculator.settings_types,
+                                 AeroForcesCalculator.settings_default)
+        self.calculator.settings = calculator_settings
+        self.calculator.folder = os.path.join(self.output_dir.name, calculator_settings['text_file_name'])
+        self.calculator.file_output()
+
+    def test_text_file_matches_savetxt(self):
+        """
+        The text file has to be identical, byte for byte, to the one written by ``np.savetxt``
+        """
+        self.run_file_output(write_text_file=True, write_binary_file=False)
+
+        reference_file = os.path.join(self.output_dir.name, 'reference.txt')
+        np.savetxt(reference_file,
+                   self.expected_matrix,
+                   fmt='%i' + ', %10e'*12,
+                   delimiter=',',
+                   header=self.header,
+                   comments='#')
+
+        with open(self.calculator.folder, 'rb') as outfile:
+            output = outfile.read()
+        with open(reference_file, 'rb') as reference:
+            self.assertEqual(output, reference.read())
+        self.assertFalse(os.path.exists(os.path.splitext(self.calculator.folder)[0] + '.npy'))
+
+    def test_binary_file(self):
+        """
+        The binary file holds the force matrix at full precision
+        """
+        self.run_file_output(write_text_file=False, write_binary_file=True)
+
+        force_matrix = np.load(os.path.splitext(self.calculator.folder)[0] + '.npy')
+        np.testing.assert_array_equal(force_matrix, self.expected_matrix)
+        self.assertFalse(os.path.exists(self.calculator.folder))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+
+from sharpy.postproc.aerogridplot import AerogridPlot
+
+
+class TestAerogridPlotOrdering(unittest.TestCase):
+    """
+    Tests that the vectorised helpers of ``AerogridPlot`` reproduce the vertex and panel ordering of the original
+    nested loops
+    """
+
+    def setUp(self):
+        np.random.seed(2)
+
+    @staticmethod
+    def loop_ordering(point_vector, cell_vector, cell_scalar, m, n):
+        """
+        Construction of the point and cell data and connectivity with the original ``counter``/``node_counter`` loops
+        """
+        point_data = np.zeros(((m + 1)*(n + 1), 3))
+        cell_vector_data = np.zeros((m*n, 3))
+        cell_scalar_data = np.zeros((m*n,))
+        conn = []
+        counter = -1
+        node_counter = -1
+        for i_n in range(n + 1):
+            for i_m in range(m + 1):
+                node_counter += 1
+                point_data[node_counter, :] = point_vector[:, i_m, i_n]
+                if i_n < n and i_m < m:
+                    counter += 1
+                else:
+                    continue
+
+                conn.append([node_counter + 0,
+                             node_counter + 1,
+                             node_counter + m + 2,
+                             node_counter + m + 1])
+                cell_vector_data[counter, :] = cell_vector[:, i_m, i_n]
+                cell_scalar_data[counter] = cell_scalar[i_m, i_n]
+
+        return point_data, cell_vector_data, cell_scalar_data, np.array(conn)
+
+    def test_ordering(self):
+        # non-square grids, with more chordwise than spanwise panels and vice versa
+        for m, n in [(3, 5), (6, 2), (1, 4)]:
+            with self.subTest(m=m, n=n):
+                point_vector = np.random.randn(3, m + 1, n + 1)
+                cell_vector = np.random.randn(3, m, n)
+                cell_scalar = np.random.randn(m, n)
+
+                point_data, cell_vector_data, cell_scalar_data, conn = self.loop_ordering(point_vector,
+                                                                                          cell_vector,
+                                                                                          cell_scalar,
+                                                                                          m, n)
+
+                np.testing.assert_array_equal(AerogridPlot.grid_to_vtk_order(point_vector), point_data)
+                np.testing.assert_array_equal(AerogridPlot.grid_to_vtk_order(cell_vector), cell_vector_data)
+                np.testing.assert_array_equal(AerogridPlot.grid_to_vtk_order(cell_scalar), cell_scalar_data)
+                np.testing.assert_array_equal(AerogridPlot.quad_connectivity(m, n), conn)
+
+    def test_wake_ordering(self):
+        """
+        Only the first ``m_star`` streamwise panels of the wake are plotted when ``minus_m_star > 0``
+        """
+        m_star, n, minus_m_star = 7, 3, 2
+        zeta_star = np.random.randn(3, m_star + 1, n + 1)
+        gamma_star = np.random.randn(m_star, n)
+        m = m_star - minus_m_star
+
+        point_data, _, cell_scalar_data, conn = self.loop_ordering(zeta_star[:, :m + 1, :],
+                                                                   np.zeros((3, m, n)),
+                                                                   gamma_star[:m, :],
+                                                                   m, n)
+
+        np.testing.assert_array_equal(AerogridPlot.grid_to_vtk_order(zeta_star[:, :m + 1, :]), point_data)
+        np.testing.assert_array_equal(AerogridPlot.grid_to_vtk_order(gamma_star[:m, :]), cell_scalar_data)
+        np.testing.assert_array_equal(AerogridPlot.quad_connectivity(m, n), conn)
+
+
+if __name__ == '__main__':
+    unittest.main()